@@ -0,0 +1,54 @@
+# Lesson HTML bodies are several KB each and live in TOAST storage. Compress
+# them with lz4 instead of the default pglz where the server supports it
+# (PostgreSQL 14+ built with lz4). PostgreSQL decompresses transparently on
+# read, so the model and the API are unchanged. Values are recompressed the
+# next time they are written, e.g. by scripts/create_testing_course.py.
+
+from django.db import migrations
+
+LESSON_HTML_COLUMNS = ('content', 'basic_content', 'intermediate_content')
+
+
+def _supports_column_compression(connection):
+    return connection.vendor == 'postgresql' and connection.pg_version >= 140000
+
+
+def _set_compression(schema_editor, method):
+    table = schema_editor.quote_name('courses_lesson')
+    for column in LESSON_HTML_COLUMNS:
+        schema_editor.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {schema_editor.quote_name(column)} "
+            f"SET COMPRESSION {method}"
+        )
+
+
+def use_lz4(apps, schema_editor):
+    connection = schema_editor.connection
+    if not _supports_column_compression(connection):
+        return
+
+    with connection.cursor() as cursor:
+        # enumvals only lists the methods this server was compiled with
+        cursor.execute(
+            "SELECT 'lz4' = ANY(enumvals) FROM pg_settings "
+            "WHERE name = 'default_toast_compression'"
+        )
+        row = cursor.fetchone()
+    if row and row[0]:
+        _set_compression(schema_editor, 'lz4')
+
+
+def use_default(apps, schema_editor):
+    if _supports_column_compression(schema_editor.connection):
+        _set_compression(schema_editor, 'DEFAULT')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0003_lesson_access_level_lesson_basic_content_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(use_lz4, use_default),
+    ]
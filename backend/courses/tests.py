@@ -1,3 +1,115 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .models import (
+    Category, Course, Module, Lesson, Assessment, Question, Answer,
+    Enrollment, Progress, AssessmentAttempt, AttemptAnswer
+)
+
+User = get_user_model()
+
+
+class SubmitAssessmentTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('student@example.com', 'student')
+        category = Category.objects.create(name='Testing')
+        course = Course.objects.create(
+            title='Course', description='Course', category=category)
+        module = Module.objects.create(course=course, title='Module')
+        cls.lesson = Lesson.objects.create(
+            module=module, title='Lesson', content='Lesson', has_assessment=True)
+        cls.assessment = Assessment.objects.create(
+            lesson=cls.lesson, title='Quiz', passing_score=70)
+        Enrollment.objects.create(user=cls.user, course=course)
+
+        cls.multiple_choice = Question.objects.create(
+            assessment=cls.assessment, question_text='Pick one',
+            question_type='multiple_choice', order=1, points=2)
+        cls.mc_right = Answer.objects.create(
+            question=cls.multiple_choice, answer_text='Right', is_correct=True)
+        cls.mc_wrong = Answer.objects.create(
+            question=cls.multiple_choice, answer_text='Wrong')
+
+        cls.true_false = Question.objects.create(
+            assessment=cls.assessment, question_text='True?',
+            question_type='true_false', order=2, points=1)
+        Answer.objects.create(
+            question=cls.true_false, answer_text='True', is_correct=True)
+        cls.tf_false = Answer.objects.create(
+            question=cls.true_false, answer_text='False')
+
+        cls.short_answer = Question.objects.create(
+            assessment=cls.assessment, question_text='Name it',
+            question_type='short_answer', order=3, points=3)
+        Answer.objects.create(
+            question=cls.short_answer, answer_text='Regression', is_correct=True)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.attempt = AssessmentAttempt.objects.create(
+            user=self.user, assessment=self.assessment)
+
+    def submit(self, answers):
+        return self.client.put(
+            reverse('submit-assessment', args=[self.attempt.pk]),
+            {'answers': answers}, format='json')
+
+    def test_mixed_question_types_are_graded(self):
+        response = self.submit([
+            {'question_id': self.multiple_choice.pk, 'answer_id': self.mc_right.pk},
+            {'question_id': str(self.true_false.pk), 'answer_id': str(self.tf_false.pk)},
+            # answer_id is ignored for short-answer questions
+            {'question_id': self.short_answer.pk, 'answer_id': 'ignored',
+             'text_answer': '  regression '},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        # 2 + 0 + 3 out of 6 points
+        self.assertEqual(response.data['score'], 5)
+        self.assertAlmostEqual(response.data['score_percentage'], 500 / 6)
+        self.assertTrue(response.data['passed'])
+        self.assertEqual(
+            dict(AttemptAnswer.objects.filter(attempt=self.attempt)
+                 .values_list('question_id', 'points_earned')),
+            {self.multiple_choice.pk: 2, self.true_false.pk: 0, self.short_answer.pk: 3})
+        self.assertTrue(Progress.objects.get(lesson=self.lesson).is_completed)
+
+    def test_failing_score_is_not_passed(self):
+        response = self.submit([
+            {'question_id': self.multiple_choice.pk, 'answer_id': self.mc_wrong.pk},
+            {'question_id': self.short_answer.pk, 'text_answer': 'Smoke'},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['score'], 0)
+        self.assertEqual(response.data['score_percentage'], 0)
+        self.assertFalse(response.data['passed'])
+        self.assertFalse(Progress.objects.exists())
+
+    def test_submitted_ids_are_normalised(self):
+        response = self.submit([
+            {'question_id': f' {self.multiple_choice.pk}',
+             'answer_id': f'0{self.mc_right.pk}'},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['score'], 2)
+
+    def test_missing_question_returns_404(self):
+        for question_id in (999999, 'abc', None):
+            response = self.submit([{'question_id': question_id}])
+            self.assertEqual(response.status_code, 404, question_id)
+        self.assertFalse(AttemptAnswer.objects.exists())
+
+    def test_missing_answer_returns_404(self):
+        for answer_id in (999999, 'abc'):
+            response = self.submit([
+                {'question_id': self.multiple_choice.pk, 'answer_id': answer_id},
+            ])
+            self.assertEqual(response.status_code, 404, answer_id)
+        self.assertFalse(AttemptAnswer.objects.exists())
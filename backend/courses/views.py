@@ -31,6 +31,7 @@ from django.contrib.auth.models import User
 from django.utils import timezone
 from django.db.models import Count, Avg, Sum
 from django.shortcuts import get_object_or_404
+from django.http import Http404
 
 from .models import (
     Category, Course, Module, Lesson, Resource, Assessment,
@@ -58,7 +59,9 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
 
 
 class LessonViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Lesson.objects.all()
+    # LessonSerializer nests the assessment with its questions and answers
+    queryset = Lesson.objects.select_related('assessment').prefetch_related(
+        'resources', 'assessment__questions__answers')
     serializer_class = LessonSerializer
 
     # Update permission_classes to allow unauthenticated access with restrictions
@@ -406,7 +409,7 @@ class CompleteLesson(generics.UpdateAPIView):
 
 
 class AssessmentDetailView(generics.RetrieveAPIView):
-    queryset = Assessment.objects.all()
+    queryset = Assessment.objects.prefetch_related('questions__answers')
     serializer_class = AssessmentSerializer
     permission_classes = [IsEnrolled]
 
@@ -439,6 +442,22 @@ class StartAssessment(generics.CreateAPIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+# Question types graded by the answer the student selected
+CHOICE_QUESTION_TYPES = ('multiple_choice', 'true_false')
+
+
+def submitted_pk(value, model):
+    """
+    Convert a submitted primary key to an int the way a pk lookup would,
+    so "5", " 5" and "01" still match. Input that no pk can match raises
+    Http404, as get_object_or_404 did for a missing row.
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise Http404(f'No {model._meta.object_name} matches the given query.')
+
+
 class SubmitAssessment(generics.UpdateAPIView):
     permission_classes = [IsEnrolled]
 
@@ -453,42 +472,65 @@ class SubmitAssessment(generics.UpdateAPIView):
         # Mark attempt as completed
         attempt.end_time = timezone.now()
 
-        # Process answers
+        # Process answers. Questions, selected answers and the correct
+        # answers for short-answer questions are each fetched in one query
+        # instead of once per submitted answer.
         answers_data = request.data.get('answers', [])
         total_score = 0
 
-        for answer_data in answers_data:
-            question_id = answer_data.get('question_id')
+        submitted = [
+            (submitted_pk(answer_data.get('question_id'), Question), answer_data)
+            for answer_data in answers_data
+        ]
+        questions = Question.objects.in_bulk({question_id for question_id, _ in submitted})
+        for question_id, _ in submitted:
+            if question_id not in questions:
+                raise Http404('No Question matches the given query.')
+
+        # Only choice questions read answer_id, as in the per-answer lookups
+        selected_answers = Answer.objects.in_bulk({
+            submitted_pk(answer_data['answer_id'], Answer)
+            for question_id, answer_data in submitted
+            if questions[question_id].question_type in CHOICE_QUESTION_TYPES
+            and answer_data.get('answer_id')
+        })
+        correct_answers = {}
+        for answer in Answer.objects.filter(
+                question__in=[q for q in questions.values() if q.question_type == 'short_answer'],
+                is_correct=True).order_by('pk'):
+            correct_answers.setdefault(answer.question_id, answer)
+
+        attempt_answers = []
+        for question_id, answer_data in submitted:
             selected_answer_id = answer_data.get('answer_id')
             text_answer = answer_data.get('text_answer', '')
 
-            question = get_object_or_404(Question, pk=question_id)
+            question = questions[question_id]
 
             # For multiple choice and true/false questions
-            if question.question_type in ['multiple_choice', 'true_false']:
+            if question.question_type in CHOICE_QUESTION_TYPES:
                 if selected_answer_id:
-                    selected_answer = get_object_or_404(
-                        Answer, pk=selected_answer_id)
+                    selected_answer = selected_answers.get(
+                        submitted_pk(selected_answer_id, Answer))
+                    if selected_answer is None:
+                        raise Http404('No Answer matches the given query.')
                     is_correct = selected_answer.is_correct
                     points_earned = question.points if is_correct else 0
 
-                    AttemptAnswer.objects.create(
+                    attempt_answers.append(AttemptAnswer(
                         attempt=attempt,
                         question=question,
                         selected_answer=selected_answer,
                         is_correct=is_correct,
                         points_earned=points_earned
-                    )
+                    ))
 
                     total_score += points_earned
 
             # For short answer questions (simplified - would need more sophisticated matching in production)
             elif question.question_type == 'short_answer' and text_answer:
                 # Get correct answer
-                correct_answer = Answer.objects.filter(
-                    question=question,
-                    is_correct=True
-                ).first()
+                correct_answer = correct_answers.get(question.pk)
 
                 is_correct = False
                 points_earned = 0
@@ -497,19 +539,22 @@ class SubmitAssessment(generics.UpdateAPIView):
                     is_correct = True
                     points_earned = question.points
 
-                AttemptAnswer.objects.create(
+                attempt_answers.append(AttemptAnswer(
                     attempt=attempt,
                     question=question,
                     text_answer=text_answer,
                     is_correct=is_correct,
                     points_earned=points_earned
-                )
+                ))
 
                 total_score += points_earned
 
+        AttemptAnswer.objects.bulk_create(attempt_answers)
+
         # Save total score and determine if passed
         attempt.score = total_score
-        max_score = sum(q.points for q in attempt.assessment.questions.all())
+        max_score = attempt.assessment.questions.aggregate(
+            total=Sum('points'))['total'] or 0
 
         if max_score > 0:
             score_percentage = (total_score / max_score) * 100
@@ -132,6 +132,11 @@ DATABASES = {
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
         'CONN_MAX_AGE': 600,
+        # Set to true when DB_HOST/DB_PORT point at PgBouncer in transaction
+        # pooling mode, which cannot keep the server-side cursors opened by
+        # QuerySet.iterator() across transactions
+        'DISABLE_SERVER_SIDE_CURSORS': os.getenv(
+            'DB_DISABLE_SERVER_SIDE_CURSORS', 'False').lower() == 'true',
     }
 }
 
@@ -297,15 +297,18 @@ class InstructorAssessmentViewSet(viewsets.ModelViewSet):
     permission_classes = [IsInstructorOrAdmin]
 
     def get_queryset(self):
+        # The serializer nests every question with its answers
+        assessments = Assessment.objects.prefetch_related('questions__answers')
+
         # Filter by lesson if specified
         lesson_id = self.request.query_params.get('lesson')
         if lesson_id:
-            return Assessment.objects.filter(lesson_id=lesson_id)
+            return assessments.filter(lesson_id=lesson_id)
 
         # Otherwise, return all assessments for lessons where the user is an instructor
         if self.request.user.role == 'administrator' or self.request.user.is_staff:
-            return Assessment.objects.all()
-        return Assessment.objects.filter(lesson__module__course__instructors__instructor=self.request.user)
+            return assessments
+        return assessments.filter(lesson__module__course__instructors__instructor=self.request.user)
 
     def perform_create(self, serializer):
         lesson_id = self.request.data.get('lesson')
@@ -1,14 +1,13 @@
 from django.conf import settings
-from django.db import connection
+from django.db import DatabaseError, OperationalError, connection
 import os
 import sys
 import django
-import json
 from datetime import datetime
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
 import argparse
+from psycopg2.errors import QueryCanceled
 
 # Add project path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,9 +17,58 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'educore.settings')
 django.setup()
 
 # Import Django modules
+from db_utils import write_json_report
 
+# Upper bound for the health check query, so a stuck server makes the check
+# fail instead of hanging a cron job
+HEALTH_CHECK_TIMEOUT_MS = 5000
 
-def run_health_check(send_email=False, email_recipient=None):
+# Metrics for every health check as a single JSON object, built by the
+# server in one round-trip. Each key matches one check in run_health_check();
+# the per-table checks only return the tables over their threshold.
+HEALTH_CHECK_SQL = """
+    SELECT json_build_object(
+        'connection_count',
+        (SELECT count(*) FROM pg_stat_activity
+         WHERE datname = current_database()),
+        'long_query_count',
+        (SELECT count(*) FROM pg_stat_activity
+         WHERE datname = current_database()
+           AND state = 'active'
+           AND (now() - query_start) > interval '30 seconds'),
+        'size_mb',
+        pg_database_size(current_database()) / (1024*1024),
+        'bloat_rows',
+        (SELECT coalesce(json_agg(json_build_object(
+                    'table', relname, 'dead_ratio', dead_ratio)
+                    ORDER BY dead_ratio DESC), '[]')
+         FROM (SELECT relname,
+                      n_dead_tup::float / nullif(n_live_tup, 0) AS dead_ratio
+               FROM pg_stat_user_tables
+               WHERE n_live_tup > 1000
+                 -- >20% dead tuples
+                 AND n_dead_tup::float / nullif(n_live_tup, 0) > 0.2
+               ORDER BY dead_ratio DESC
+               LIMIT 5) AS bloat),
+        'index_rows',
+        (SELECT coalesce(json_agg(json_build_object(
+                    'table', relname, 'index_usage_ratio', index_usage_ratio)
+                    ORDER BY index_usage_ratio ASC), '[]')
+         FROM (SELECT relname,
+                      idx_scan::float / nullif(seq_scan, 0) AS index_usage_ratio
+               FROM pg_stat_user_tables
+               WHERE seq_scan > 100
+                 -- More sequential scans than index scans; idx_scan is
+                 -- NULL for tables without indexes, which are kept
+                 AND (idx_scan IS NULL
+                      OR idx_scan::float / nullif(seq_scan, 0) < 1.0)
+               ORDER BY index_usage_ratio ASC
+               LIMIT 5) AS index_usage)
+    )
+"""
+
+
+def run_health_check(send_email=False, email_recipient=None, pretty=False):
     """Run database health checks."""
 
     results = {
@@ -32,14 +80,8 @@ def run_health_check(send_email=False, email_recipient=None):
 
     # Check 1: Database connectivity
     try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-            results['checks'].append({
-                'name': 'connectivity',
-                'status': 'passed',
-                'message': 'Successfully connected to database'
-            })
-    except Exception as e:
+        connection.ensure_connection()
+    except OperationalError as e:
         results['status'] = 'critical'
         results['issues'].append(f"Cannot connect to database: {str(e)}")
         results['checks'].append({
@@ -47,169 +89,135 @@ def run_health_check(send_email=False, email_recipient=None):
             'status': 'failed',
             'message': str(e)
         })
-
-    # Check 2: Connection count (too many connections might indicate a leak)
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT count(*) FROM pg_stat_activity 
-                WHERE datname = current_database()
-            """)
-            count = cursor.fetchone()[0]
+        for name in ('connection_count', 'long_queries', 'disk_usage',
+                     'table_bloat', 'index_usage'):
             results['checks'].append({
-                'name': 'connection_count',
-                'status': 'passed' if count < 80 else 'warning',
-                'message': f"{count} active connections",
-                'value': count
+                'name': name,
+                'status': 'error',
+                'message': f"Check skipped: {str(e)}"
             })
-            if count >= 80:
-                results['status'] = 'warning'
-                results['issues'].append(
-                    f"High number of connections: {count}")
-    except Exception as e:
-        results['checks'].append({
-            'name': 'connection_count',
-            'status': 'error',
-            'message': f"Error checking connections: {str(e)}"
-        })
+        return report_health_check(results, send_email, email_recipient, pretty)
 
-    # Check 3: Long-running queries
+    results['checks'].append({
+        'name': 'connectivity',
+        'status': 'passed',
+        'message': 'Successfully connected to database'
+    })
+
+    # The other checks read their metrics from a single query, so the health
+    # check costs one round-trip. The server returns them as one JSON
+    # object, which psycopg2 decodes into a dict. The timeout is sent
+    # in the same simple query, whose implicit transaction scopes SET LOCAL
+    # to this statement; that also keeps it safe behind PgBouncer.
+    # The connection works, so a failure here (e.g. no permission on a
+    # statistics view) is reported as a failed metrics check.
     try:
         with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT count(*) FROM pg_stat_activity 
-                WHERE datname = current_database()
-                  AND state = 'active'
-                  AND (now() - query_start) > interval '30 seconds'
-            """)
-            count = cursor.fetchone()[0]
+            cursor.execute(
+                f"SET LOCAL statement_timeout = {HEALTH_CHECK_TIMEOUT_MS}; {HEALTH_CHECK_SQL}")
+            metrics = cursor.fetchone()[0]
+    except DatabaseError as e:
+        results['status'] = 'warning'
+        if isinstance(e.__cause__, QueryCanceled):
+            # A slow catalog query on a busy server, not an outage
+            message = f"Health check timed out after {HEALTH_CHECK_TIMEOUT_MS} ms"
+            results['issues'].append(message)
             results['checks'].append({
-                'name': 'long_queries',
-                'status': 'passed' if count == 0 else 'warning',
-                'message': f"{count} queries running longer than 30 seconds",
-                'value': count
+                'name': 'metrics',
+                'status': 'warning',
+                'message': message
             })
-            if count > 0:
-                results['status'] = 'warning'
-                results['issues'].append(
-                    f"{count} long-running queries detected")
-    except Exception as e:
-        results['checks'].append({
-            'name': 'long_queries',
-            'status': 'error',
-            'message': f"Error checking long queries: {str(e)}"
-        })
-
-    # Check 4: Disk usage
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT pg_database_size(current_database()) / (1024*1024) as size_mb
-            """)
-            size_mb = cursor.fetchone()[0]
+        else:
+            results['issues'].append(f"Cannot read health metrics: {str(e)}")
             results['checks'].append({
-                'name': 'disk_usage',
-                'status': 'passed' if size_mb < 10000 else 'warning',  # Warning if > 10GB
-                'message': f"Database size: {size_mb:.2f} MB",
-                'value': size_mb
+                'name': 'metrics',
+                'status': 'failed',
+                'message': f"Error reading health metrics: {str(e)}"
             })
-    except Exception as e:
-        results['checks'].append({
-            'name': 'disk_usage',
-            'status': 'error',
-            'message': f"Error checking disk usage: {str(e)}"
-        })
+        return report_health_check(results, send_email, email_recipient, pretty)
+
+    connection_count = metrics['connection_count']
+    long_query_count = metrics['long_query_count']
+    size_mb = metrics['size_mb']
+
+    # Check 2: Connection count (too many connections might indicate a leak)
+    results['checks'].append({
+        'name': 'connection_count',
+        'status': 'passed' if connection_count < 80 else 'warning',
+        'message': f"{connection_count} active connections",
+        'value': connection_count
+    })
+    if connection_count >= 80:
+        results['status'] = 'warning'
+        results['issues'].append(
+            f"High number of connections: {connection_count}")
+
+    # Check 3: Long-running queries
+    results['checks'].append({
+        'name': 'long_queries',
+        'status': 'passed' if long_query_count == 0 else 'warning',
+        'message': f"{long_query_count} queries running longer than 30 seconds",
+        'value': long_query_count
+    })
+    if long_query_count > 0:
+        results['status'] = 'warning'
+        results['issues'].append(
+            f"{long_query_count} long-running queries detected")
+
+    # Check 4: Disk usage
+    results['checks'].append({
+        'name': 'disk_usage',
+        'status': 'passed' if size_mb < 10000 else 'warning',  # Warning if > 10GB
+        'message': f"Database size: {size_mb:.2f} MB",
+        'value': size_mb
+    })
 
     # Check 5: Dead tuples ratio (table bloat)
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT relname, 
-                       n_dead_tup::float / nullif(n_live_tup, 0) as dead_ratio
-                FROM pg_stat_user_tables
-                WHERE n_live_tup > 1000
-                ORDER BY dead_ratio DESC
-                LIMIT 5
-            """)
-            bloated_tables = []
-            for row in cursor.fetchall():
-                if row[1] and row[1] > 0.2:  # >20% dead tuples
-                    bloated_tables.append({
-                        'table': row[0],
-                        'dead_ratio': row[1]
-                    })
-
-            if bloated_tables:
-                results['status'] = 'warning'
-                results['issues'].append(
-                    f"{len(bloated_tables)} tables have high dead tuple ratios")
-                results['checks'].append({
-                    'name': 'table_bloat',
-                    'status': 'warning',
-                    'message': f"{len(bloated_tables)} tables need vacuum",
-                    'tables': bloated_tables
-                })
-            else:
-                results['checks'].append({
-                    'name': 'table_bloat',
-                    'status': 'passed',
-                    'message': "No significant table bloat detected"
-                })
-    except Exception as e:
+    bloated_tables = metrics['bloat_rows']
+    if bloated_tables:
+        results['status'] = 'warning'
+        results['issues'].append(
+            f"{len(bloated_tables)} tables have high dead tuple ratios")
+        results['checks'].append({
+            'name': 'table_bloat',
+            'status': 'warning',
+            'message': f"{len(bloated_tables)} tables need vacuum",
+            'tables': bloated_tables
+        })
+    else:
         results['checks'].append({
             'name': 'table_bloat',
-            'status': 'error',
-            'message': f"Error checking table bloat: {str(e)}"
+            'status': 'passed',
+            'message': "No significant table bloat detected"
         })
 
     # Check 6: Index usage
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT relname, 
-                       idx_scan::float / nullif(seq_scan, 0) as index_usage_ratio
-                FROM pg_stat_user_tables
-                WHERE seq_scan > 100
-                ORDER BY index_usage_ratio ASC
-                LIMIT 5
-            """)
-            low_index_tables = []
-            for row in cursor.fetchall():
-                if row[1] is None or row[1] < 1.0:  # More sequential scans than index scans
-                    low_index_tables.append({
-                        'table': row[0],
-                        'index_usage_ratio': row[1]
-                    })
-
-            if low_index_tables:
-                results['status'] = 'warning'
-                results['issues'].append(
-                    f"{len(low_index_tables)} tables have low index usage")
-                results['checks'].append({
-                    'name': 'index_usage',
-                    'status': 'warning',
-                    'message': f"{len(low_index_tables)} tables may need better indexes",
-                    'tables': low_index_tables
-                })
-            else:
-                results['checks'].append({
-                    'name': 'index_usage',
-                    'status': 'passed',
-                    'message': "Indexes are being used efficiently"
-                })
-    except Exception as e:
+    low_index_tables = metrics['index_rows']
+    if low_index_tables:
+        results['status'] = 'warning'
+        results['issues'].append(
+            f"{len(low_index_tables)} tables have low index usage")
+        results['checks'].append({
+            'name': 'index_usage',
+            'status': 'warning',
+            'message': f"{len(low_index_tables)} tables may need better indexes",
+            'tables': low_index_tables
+        })
+    else:
         results['checks'].append({
             'name': 'index_usage',
-            'status': 'error',
-            'message': f"Error checking index usage: {str(e)}"
+            'status': 'passed',
+            'message': "Indexes are being used efficiently"
         })
 
+    return report_health_check(results, send_email, email_recipient, pretty)
+
+
+def report_health_check(results, send_email=False, email_recipient=None, pretty=False):
+    """Write the health check results to disk, print them and alert if needed."""
     # Output report
     output_file = f'../monitoring/health_check_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-    os.makedirs('../monitoring', exist_ok=True)
-
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    write_json_report(output_file, results, pretty)
 
     print(f"Health check results written to {output_file}")
     print(f"Status: {results['status'].upper()}")
@@ -229,7 +237,14 @@ def run_health_check(send_email=False, email_recipient=None):
 def send_email_alert(results, recipient):
     """Send email alert about database issues."""
     try:
-        msg = MIMEMultipart()
+        issues_html = ''.join(f'<li>{issue}</li>' for issue in results['issues'])
+        checks_html = ''.join(
+            f'<tr><td>{check["name"]}</td><td>{check["status"]}</td><td>{check["message"]}</td></tr>'
+            for check in results['checks']
+        )
+
+        # A single HTML part needs no multipart container
+        msg = EmailMessage()
         msg['Subject'] = f"[{results['status'].upper()}] Database Health Alert - Educational Platform"
         msg['From'] = "eduplatform-monitor@example.com"
         msg['To'] = recipient
@@ -243,7 +258,7 @@ def send_email_alert(results, recipient):
             
             <h3>Issues:</h3>
             <ul>
-                {''.join([f'<li>{issue}</li>' for issue in results['issues']])}
+                {issues_html}
             </ul>
             
             <h3>Check Details:</h3>
@@ -253,7 +268,7 @@ def send_email_alert(results, recipient):
                     <th>Status</th>
                     <th>Message</th>
                 </tr>
-                {''.join([f'<tr><td>{check["name"]}</td><td>{check["status"]}</td><td>{check["message"]}</td></tr>' for check in results['checks']])}
+                {checks_html}
             </table>
             
             <p>Please check the database monitoring dashboard for more details.</p>
@@ -261,7 +276,7 @@ def send_email_alert(results, recipient):
         </html>
         """
 
-        msg.attach(MIMEText(body, 'html'))
+        msg.set_content(body, subtype='html')
 
         # Send email (configure your SMTP server details)
         smtp_server = os.environ.get('SMTP_SERVER', 'smtp.example.com')
@@ -287,6 +302,8 @@ if __name__ == "__main__":
     parser.add_argument('--email', action='store_true',
                         help='Send email if issues found')
     parser.add_argument('--recipient', type=str, help='Email recipient')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent the JSON report for reading')
     args = parser.parse_args()
 
-    run_health_check(args.email, args.recipient)
+    run_health_check(args.email, args.recipient, args.pretty)
@@ -5,13 +5,12 @@ Author: nanthiniSanthanam
 Date: 2025-04-21
 """
 
-from django.apps import apps
 from django.db import connection, connections
 import os
 import sys
 import django
 import time
-import json
+import argparse
 from datetime import datetime
 
 # Add the project path to the Python path
@@ -22,6 +21,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'educore.settings')
 django.setup()
 
 # Import Django modules
+from db_utils import count_models, installed_models, write_json_report
 
 
 def get_connection_stats():
@@ -85,24 +85,24 @@ def get_connection_stats():
 def get_model_stats():
     """Get statistics for each model."""
     model_stats = []
-    for model in apps.get_models():
-        model_name = f"{model._meta.app_label}.{model._meta.object_name}"
-        try:
-            count = model.objects.count()
+    models = installed_models()
+    counts = count_models(model for model, _ in models)
+    for (_, model_name), (_, count, error) in zip(models, counts):
+        if error is None:
             model_stats.append({
                 'model': model_name,
                 'count': count
             })
-        except Exception as e:
+        else:
             model_stats.append({
                 'model': model_name,
-                'error': str(e)
+                'error': str(error)
             })
 
     return model_stats
 
 
-def run_monitor():
+def run_monitor(pretty=False):
     """Run monitoring and output results."""
     try:
         # Collect statistics
@@ -111,15 +111,10 @@ def run_monitor():
             'model_stats': get_model_stats()
         }
 
-        # Create monitoring directory if it doesn't exist
-        os.makedirs('../monitoring', exist_ok=True)
-
         # Generate report file
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         report_file = f'../monitoring/db_report_{timestamp}.json'
-
-        with open(report_file, 'w') as f:
-            json.dump(stats, f, indent=2)
+        write_json_report(report_file, stats, pretty)
 
         print(f"Monitoring report generated: {report_file}")
 
@@ -140,4 +135,9 @@ def run_monitor():
 
 
 if __name__ == "__main__":
-    run_monitor()
+    parser = argparse.ArgumentParser(description='Database Monitor')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent the JSON report for reading')
+    args = parser.parse_args()
+
+    run_monitor(args.pretty)
@@ -0,0 +1,77 @@
+"""
+Database helpers shared by the maintenance scripts in this directory.
+Author: nanthiniSanthanam
+Date: 2025-04-21
+"""
+
+import functools
+import json
+import os
+
+from django.apps import apps
+from django.db import DatabaseError, connection
+
+
+@functools.lru_cache(maxsize=None)
+def installed_models():
+    """
+    Return ``(model, label)`` pairs for every installed model, where label
+    is ``"app_label.ModelName"``. Built once per process.
+    """
+    return tuple(
+        (model, f"{model._meta.app_label}.{model._meta.object_name}")
+        for model in apps.get_models()
+    )
+
+
+def count_models(models):
+    """
+    Count the rows of each model with a single UNION ALL query instead of
+    one COUNT(*) round-trip per model.
+
+    Returns a list of ``(model, count, error)`` tuples in the order given,
+    where exactly one of ``count`` and ``error`` is set. Counts go through
+    each model's default manager, as ``Model.objects.count()`` would. If the
+    combined query fails, e.g. because a table has not been migrated yet,
+    the models are counted one by one so the error is reported against the
+    model that caused it.
+    """
+    models = list(models)
+    parts = []
+    params = []
+    for index, model in enumerate(models):
+        sql, query_params = model._default_manager.order_by().values('pk').query.sql_with_params()
+        parts.append(f"SELECT {index}, COUNT(*) FROM ({sql}) AS counted_{index}")
+        params.extend(query_params)
+    if not parts:
+        return []
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(" UNION ALL ".join(parts), params)
+            counts = dict(cursor.fetchall())
+    except DatabaseError:
+        return [_count_model(model) for model in models]
+    return [(model, counts[index], None) for index, model in enumerate(models)]
+
+
+def _count_model(model):
+    """Count one model, returning ``(model, count, error)``."""
+    try:
+        return model, model._default_manager.count(), None
+    except Exception as e:
+        return model, None, e
+
+
+def write_json_report(path, data, pretty=False):
+    """
+    Write a monitoring report to ``path``, creating its directory if needed.
+    Reports are written compactly unless ``pretty`` is set, since they pile
+    up on every scheduled run and are read by tools rather than people.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        if pretty:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(',', ':'))
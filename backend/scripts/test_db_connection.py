@@ -10,6 +10,7 @@ from django.db import connections
 import os
 import sys
 import django
+import socket
 import time
 
 # Add the project path to the Python path
@@ -20,15 +21,41 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'educore.settings')
 django.setup()
 
 # Now you can import Django modules
+from db_utils import count_models, installed_models
+
+# Seconds to wait for the database port to accept a TCP connection
+TCP_PROBE_TIMEOUT = 0.5
+
+
+def tcp_probe(host, port, timeout=TCP_PROBE_TIMEOUT):
+    """
+    Return None if a TCP connection to host:port can be opened within
+    ``timeout`` seconds, otherwise the error. This fails fast on a host that
+    is down or unreachable, before libpq waits out its own connect timeout.
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return None
+    except OSError as e:
+        return e
 
 
 def test_connection():
     """Test connection to the PostgreSQL database."""
     print("Testing connection to PostgreSQL database...")
 
+    db_conn = connections['default']
+    host = db_conn.settings_dict.get('HOST')
+    # An empty host or a directory means a Unix socket, which has no port
+    if host and not host.startswith('/'):
+        port = int(db_conn.settings_dict.get('PORT') or 5432)
+        error = tcp_probe(host, port)
+        if error is not None:
+            print(f"Connection failed: cannot reach {host}:{port} ({error})")
+            return False
+
     try:
         # Attempt to get a cursor
-        db_conn = connections['default']
         db_conn.cursor()
 
         # Run a simple query
@@ -39,18 +66,15 @@ def test_connection():
             print(f"PostgreSQL version: {row[0]}")
 
         # Test connection to each model
-        from django.apps import apps
-        from django.db import connection
-
         print("\nTesting access to models:")
-        for model in apps.get_models():
-            model_name = f"{model._meta.app_label}.{model._meta.object_name}"
-            try:
-                # Just count the records to test access
-                count = model.objects.count()
+        # Just count the records to test access, all models in one query
+        models = installed_models()
+        counts = count_models(model for model, _ in models)
+        for (_, model_name), (_, count, error) in zip(models, counts):
+            if error is None:
                 print(f"✓ {model_name}: {count} records")
-            except Exception as e:
-                print(f"✗ {model_name}: Error - {str(e)}")
+            else:
+                print(f"✗ {model_name}: Error - {str(error)}")
 
         return True
 
@@ -68,7 +92,9 @@ if __name__ == "__main__":
         if test_connection():
             sys.exit(0)
         elif attempt < max_attempts:
-            wait_time = 2 ** attempt  # Exponential backoff
+            # Exponential backoff: 0.25s, then 0.5s; the TCP probe makes
+            # each attempt cheap, so retries can come quickly
+            wait_time = 0.25 * 2 ** (attempt - 1)
             print(
                 f"Retrying in {wait_time} seconds... (Attempt {attempt}/{max_attempts})")
             time.sleep(wait_time)
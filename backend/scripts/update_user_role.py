@@ -34,12 +34,13 @@ def update_user_role(email, new_role):
 
 def list_users():
     """List all users and their roles"""
-    users = User.objects.all().order_by('email')
+    users = User.objects.order_by('email').values_list('email', 'role', 'is_email_verified')
     print(f"\nTotal users: {users.count()}")
     print("\nEmail                      | Role        | Is Verified")
     print("-" * 60)
-    for user in users:
-        print(f"{user.email[:25]:<25} | {user.role or 'None':<11} | {user.is_email_verified}")
+    # Stream plain tuples rather than loading every user as a model instance
+    for email, role, is_email_verified in users.iterator(chunk_size=2000):
+        print(f"{email[:25]:<25} | {role or 'None':<11} | {is_email_verified}")
 
 if __name__ == "__main__":
     if len(sys.argv) == 1:
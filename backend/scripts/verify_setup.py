@@ -5,16 +5,21 @@ Verification script to check the educational platform setup.
 
 from django.db.utils import OperationalError
 from django.contrib.auth import get_user_model
-from django.apps import apps
 from django.db import connection
 import os
 import sys
+import types
 import django
-import colorama
-from colorama import Fore, Style
 
-# Initialize colorama
-colorama.init()
+# Initialize colorama only for a terminal; redirected output (CI logs,
+# files) gets plain text and no stdout wrapper
+if sys.stdout.isatty():
+    import colorama
+    from colorama import Fore, Style
+    colorama.init()
+else:
+    Fore = Style = types.SimpleNamespace(
+        GREEN="", RED="", YELLOW="", CYAN="", RESET_ALL="")
 
 # Add the project path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -24,28 +29,28 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'educore.settings')
 django.setup()
 
 # Import Django models and apps
+from db_utils import count_models, installed_models
 
 User = get_user_model()
 
 
+STATUS_PREFIXES = {
+    "OK": f"{Fore.GREEN}✓ {Style.RESET_ALL}",
+    "WARNING": f"{Fore.YELLOW}! {Style.RESET_ALL}",
+    "ERROR": f"{Fore.RED}✗ {Style.RESET_ALL}",
+}
+
+
 def print_status(message, status, details=None):
     """Print a status message with color."""
-    if status == "OK":
-        status_color = Fore.GREEN + "✓ " + Style.RESET_ALL
-    elif status == "WARNING":
-        status_color = Fore.YELLOW + "! " + Style.RESET_ALL
-    elif status == "ERROR":
-        status_color = Fore.RED + "✗ " + Style.RESET_ALL
-    else:
-        status_color = status
-
-    print(f"{status_color} {message}")
+    lines = [f"{STATUS_PREFIXES.get(status, status)} {message}"]
 
     if details:
         # Indent details
-        detail_lines = details.split('\n')
-        for line in detail_lines:
-            print(f"    {line}")
+        lines.extend(f"    {line}" for line in details.split('\n'))
+
+    # One write per status rather than one print() per line
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def check_database_connection():
@@ -65,19 +70,19 @@ def check_database_connection():
 def check_models():
     """Check if Django models exist and can be accessed."""
     try:
-        models = apps.get_models()
+        models = installed_models()
         model_count = len(models)
         print_status("Django models", "OK", f"Found {model_count} models")
 
-        # Try to access each model's objects
-        for model in models:
-            model_name = f"{model._meta.app_label}.{model._meta.object_name}"
-            try:
-                count = model.objects.count()
+        # Try to access each model's objects; all counts come back from a
+        # single query
+        counts = count_models(model for model, _ in models)
+        for (_, model_name), (_, count, error) in zip(models, counts):
+            if error is None:
                 print_status(f"Model {model_name}", "OK",
                              f"Record count: {count}")
-            except Exception as e:
-                print_status(f"Model {model_name}", "ERROR", f"Error: {e}")
+            else:
+                print_status(f"Model {model_name}", "ERROR", f"Error: {error}")
 
         return True
     except Exception as e:
@@ -85,64 +90,70 @@ def check_models():
         return False
 
 
-def check_users():
+def check_users(user_count, superuser_count):
     """Check if users can be created and accessed."""
-    try:
-        user_count = User.objects.count()
-        print_status("User model", "OK", f"Found {user_count} users")
-
-        # Check for a superuser
-        superusers = User.objects.filter(is_superuser=True)
-        if superusers.exists():
-            print_status("Superuser", "OK",
-                         f"Found {superusers.count()} superuser(s)")
-        else:
-            print_status("Superuser", "WARNING",
-                         "No superuser found. Create one with: python manage.py createsuperuser")
-
-        return True
-    except Exception as e:
-        print_status("User model", "ERROR", f"Error: {e}")
-        return False
+    print_status("User model", "OK", f"Found {user_count} users")
 
-
-def check_table_structure():
+    # Check for a superuser
+    if superuser_count:
+        print_status("Superuser", "OK",
+                     f"Found {superuser_count} superuser(s)")
+    else:
+        print_status("Superuser", "WARNING",
+                     "No superuser found. Create one with: python manage.py createsuperuser")
+
+    return True
+
+
+def fetch_setup_stats():
+    """
+    Return the public table names, the user count and the superuser count
+    for check_table_structure() and check_users(). The counts are None when
+    the user table does not exist yet, so a half-migrated database still
+    gets its table report.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT coalesce(array_agg(tablename ORDER BY tablename), '{}')
+            FROM pg_catalog.pg_tables
+            WHERE schemaname = 'public'
+        """)
+        table_names = cursor.fetchone()[0]
+        if User._meta.db_table not in table_names:
+            return table_names, None, None
+
+        cursor.execute(f"""
+            SELECT count(*), count(*) FILTER (WHERE is_superuser)
+            FROM {connection.ops.quote_name(User._meta.db_table)}
+        """)
+        return (table_names, *cursor.fetchone())
+
+
+def check_table_structure(table_names):
     """Check the table structure in the database."""
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT tablename FROM pg_catalog.pg_tables
-                WHERE schemaname = 'public'
-                ORDER BY tablename;
-            """)
-            tables = cursor.fetchall()
-            table_names = [table[0] for table in tables]
-            print_status("Database tables", "OK",
-                         f"Found {len(tables)} tables: {', '.join(table_names)}")
-
-            # Check for essential tables
-            essential_tables = [
-                'auth_user',
-                'courses_course',
-                'courses_module',
-                'courses_lesson',
-                'courses_enrollment'
-            ]
-
-            missing_tables = [
-                table for table in essential_tables if table not in table_names]
-
-            if missing_tables:
-                print_status("Essential tables", "WARNING",
-                             f"Missing tables: {', '.join(missing_tables)}")
-            else:
-                print_status("Essential tables", "OK",
-                             "All essential tables exist")
+    print_status("Database tables", "OK",
+                 f"Found {len(table_names)} tables: {', '.join(table_names)}")
+
+    # Check for essential tables
+    essential_tables = [
+        User._meta.db_table,
+        'courses_course',
+        'courses_module',
+        'courses_lesson',
+        'courses_enrollment'
+    ]
+
+    missing_tables = [
+        table for table in essential_tables if table not in table_names]
+
+    if missing_tables:
+        print_status("Essential tables", "WARNING",
+                     f"Missing tables: {', '.join(missing_tables)}")
+    else:
+        print_status("Essential tables", "OK",
+                     "All essential tables exist")
 
-        return True
-    except Exception as e:
-        print_status("Database tables", "ERROR", f"Error: {e}")
-        return False
+    return True
 
 
 def main():
@@ -153,9 +164,23 @@ def main():
     db_ok = check_database_connection()
 
     if db_ok:
-        table_ok = check_table_structure()
+        try:
+            table_names, user_count, superuser_count = fetch_setup_stats()
+        except Exception as e:
+            print_status("Database tables", "ERROR", f"Error: {e}")
+            table_ok = False
+        else:
+            table_ok = check_table_structure(table_names)
         models_ok = check_models()
-        users_ok = check_users()
+        if not table_ok:
+            print_status("User model", "ERROR", "Skipped: database tables could not be read")
+            users_ok = False
+        elif user_count is None:
+            print_status("User model", "ERROR",
+                         f"Table {User._meta.db_table} does not exist. Run: python manage.py migrate")
+            users_ok = False
+        else:
+            users_ok = check_users(user_count, superuser_count)
 
         # Summary
         print("\n" + Fore.CYAN + "=== VERIFICATION SUMMARY ===" + Style.RESET_ALL)
@@ -12,6 +12,9 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from .models import (
     Profile, EmailVerification, PasswordReset,
     LoginLog, UserSession
@@ -20,6 +23,49 @@ from .models import (
 User = get_user_model()
 
 
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that takes the row count of a large unfiltered changelist from
+    the planner's estimate (pg_class.reltuples) instead of a COUNT(*) over
+    the whole table. Filtered and searched lists are still counted exactly.
+
+    Page slices are capped at the count, so an estimate that is too low
+    hides rows. Small tables, whose estimate can be badly stale (e.g. 0
+    right after an ANALYZE of an empty table), are always counted exactly.
+    """
+
+    # Below this many estimated rows COUNT(*) is cheap enough to run
+    ESTIMATE_THRESHOLD = 10_000
+
+    def estimated_count(self):
+        """
+        Return the planner's row estimate for the list's table, or None when
+        there is none (non-PostgreSQL backend, filtered list, or a table that
+        has never been vacuumed or analyzed).
+        """
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql' or queryset.query.where:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 until the table is first vacuumed or analyzed
+        if row and row[0] >= 0:
+            return row[0]
+        return None
+
+    @cached_property
+    def count(self):
+        estimate = self.estimated_count()
+        if estimate is not None and estimate > self.ESTIMATE_THRESHOLD:
+            return estimate
+        return super().count
+
+
 class ProfileInline(admin.StackedInline):
     """
     Inline admin for Profile model.
@@ -40,6 +86,8 @@ class CustomUserAdmin(UserAdmin):
                    'role', 'is_email_verified')
     search_fields = ('email', 'username', 'first_name', 'last_name')
     ordering = ('-date_joined',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     fieldsets = (
         (None, {'fields': ('email', 'username', 'password')}),
@@ -72,6 +120,7 @@ class EmailVerificationAdmin(admin.ModelAdmin):
     """
     list_display = ('user', 'created_at', 'expires_at',
                     'is_used', 'verified_at')
+    list_select_related = ('user',)
     list_filter = ('is_used', 'created_at')
     search_fields = ('user__email', 'user__username')
     readonly_fields = ('token', 'created_at', 'verified_at')
@@ -83,6 +132,7 @@ class PasswordResetAdmin(admin.ModelAdmin):
     """
     list_display = ('user', 'created_at', 'expires_at',
                     'is_used', 'ip_address')
+    list_select_related = ('user',)
     list_filter = ('is_used', 'created_at')
     search_fields = ('user__email', 'user__username', 'ip_address')
     readonly_fields = ('token', 'created_at', 'used_at', 'ip_address')
@@ -93,6 +143,9 @@ class LoginLogAdmin(admin.ModelAdmin):
     Admin configuration for LoginLog model.
     """
     list_display = ('user', 'timestamp', 'ip_address', 'successful')
+    list_select_related = ('user',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_filter = ('successful', 'timestamp')
     search_fields = ('user__email', 'user__username',
                      'ip_address', 'user_agent')
@@ -106,6 +159,7 @@ class UserSessionAdmin(admin.ModelAdmin):
     """
     list_display = ('user', 'ip_address', 'device_type',
                     'created_at', 'expires_at', 'is_active')
+    list_select_related = ('user',)
     list_filter = ('is_active', 'device_type', 'created_at')
     search_fields = ('user__email', 'user__username', 'ip_address', 'location')
     readonly_fields = ('session_key', 'created_at', 'last_activity')
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        """
+        Register signal handlers. New users get their Profile from
+        signals.py, so a failing import must not be swallowed.
+        """
+        from . import signals  # noqa: F401
@@ -4,16 +4,21 @@ Purpose: Custom user manager implementation
 """
 
 from django.contrib.auth.base_user import BaseUserManager
+from django.db.models import BooleanField, Case, Value, When
+from django.db.models.functions import Now
 from django.utils.translation import gettext_lazy as _
 
 
 class CustomUserManager(BaseUserManager):
     """
     Custom user manager where email is the unique identifier
-    for authentication instead of usernames.
+    instead of username for authentication.
     """
 
     def create_user(self, email, username, password=None, **extra_fields):
+        """
+        Create and save a user with the given email, username and password.
+        """
         if not email:
             raise ValueError(_('The Email field must be set'))
         if not username:
@@ -23,14 +28,60 @@ class CustomUserManager(BaseUserManager):
         user = self.model(email=email, username=username, **extra_fields)
         user.set_password(password)
         user.save(using=self._db)
+        # The profile is created by the post_save handler in signals.py
         return user
 
+    def bulk_create_users(self, rows, batch_size=1000):
+        """
+        Create many users and their profiles with one INSERT per table and
+        batch instead of two per user. ``rows`` are dicts of create_user()
+        keyword arguments.
+
+        bulk_create() sends no post_save signals, so profiles are inserted
+        here and other per-user setup done by signal handlers (e.g. learning
+        statistics) is skipped.
+        """
+        from .models import Profile  # models.py imports this module
+
+        users = []
+        for row in rows:
+            row = dict(row)
+            email, username = row.pop('email', None), row.pop('username', None)
+            if not email:
+                raise ValueError(_('The Email field must be set'))
+            if not username:
+                raise ValueError(_('The Username field must be set'))
+            password = row.pop('password', None)
+            user = self.model(email=self.normalize_email(email),
+                              username=username, **row)
+            user.set_password(password)
+            users.append(user)
+
+        users = self.bulk_create(users, batch_size=batch_size)
+        Profile.objects.using(self._db).bulk_create(
+            [Profile(user=user) for user in users], batch_size=batch_size)
+        return users
+
+    def with_lock_status(self):
+        """
+        Users annotated with ``locked``, computed in SQL from
+        temporary_ban_until, so the lock check can ride along with another
+        user query instead of needing the loaded row.
+        """
+        return self.get_queryset().annotate(locked=Case(
+            When(temporary_ban_until__gt=Now(), then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        ))
+
     def create_superuser(self, email, username, password=None, **extra_fields):
+        """
+        Create and save a SuperUser with the given email, username and password.
+        """
         extra_fields.setdefault('is_staff', True)
         extra_fields.setdefault('is_superuser', True)
         extra_fields.setdefault('is_active', True)
         extra_fields.setdefault('role', 'admin')
-        extra_fields.setdefault('is_email_verified', True)
 
         if extra_fields.get('is_staff') is not True:
             raise ValueError(_('Superuser must have is_staff=True.'))
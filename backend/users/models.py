@@ -28,54 +28,15 @@ Modified by: cadsanthanam
 """
 
 from django.db import models
-from django.contrib.auth.models import AbstractUser, BaseUserManager, PermissionsMixin
+from django.db.models import Case, F, Value, When
+from django.contrib.auth.models import AbstractUser, PermissionsMixin
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 from django.conf import settings
 import uuid
 from datetime import timedelta
 
-
-class CustomUserManager(BaseUserManager):
-    """
-    Custom user manager where email is the unique identifier
-    instead of username for authentication.
-    """
-
-    def create_user(self, email, username, password=None, **extra_fields):
-        """
-        Create and save a user with the given email, username and password.
-        """
-        if not email:
-            raise ValueError(_('The Email field must be set'))
-        if not username:
-            raise ValueError(_('The Username field must be set'))
-
-        email = self.normalize_email(email)
-        user = self.model(email=email, username=username, **extra_fields)
-        user.set_password(password)
-        user.save(using=self._db)
-
-        # Create profile automatically
-        Profile.objects.create(user=user)
-
-        return user
-
-    def create_superuser(self, email, username, password=None, **extra_fields):
-        """
-        Create and save a SuperUser with the given email, username and password.
-        """
-        extra_fields.setdefault('is_staff', True)
-        extra_fields.setdefault('is_superuser', True)
-        extra_fields.setdefault('is_active', True)
-        extra_fields.setdefault('role', 'admin')
-
-        if extra_fields.get('is_staff') is not True:
-            raise ValueError(_('Superuser must have is_staff=True.'))
-        if extra_fields.get('is_superuser') is not True:
-            raise ValueError(_('Superuser must have is_superuser=True.'))
-
-        return self.create_user(email, username, password, **extra_fields)
+from .managers import CustomUserManager
 
 
 class CustomUser(AbstractUser, PermissionsMixin):
@@ -139,29 +100,37 @@ class CustomUser(AbstractUser, PermissionsMixin):
         )
 
         if successful:
-            # Reset failed attempts on successful login
+            # Reset failed attempts on successful login. The in-memory
+            # values may be stale, so let the database decide whether
+            # there is anything to reset; most logins touch no row.
             self.failed_login_attempts = 0
             self.temporary_ban_until = None
-            self.save(update_fields=[
-                      'failed_login_attempts', 'temporary_ban_until'])
+            type(self).objects.filter(pk=self.pk).exclude(
+                failed_login_attempts=0, temporary_ban_until=None
+            ).update(failed_login_attempts=0, temporary_ban_until=None)
             return False
 
-        # Handle failed login attempt
-        self.failed_login_attempts += 1
-
-        # Implement exponential backoff for repeated failed attempts
-        if self.failed_login_attempts >= 10:
-            # Ban for 24 hours after 10 failed attempts
-            self.temporary_ban_until = timezone.now() + timedelta(hours=24)
-        elif self.failed_login_attempts >= 5:
-            # Ban for 15 minutes after 5 failed attempts
-            self.temporary_ban_until = timezone.now() + timedelta(minutes=15)
-
-        self.save(update_fields=[
-                  'failed_login_attempts', 'temporary_ban_until'])
+        # Handle failed login attempt. The counter is incremented in SQL so
+        # concurrent failures cannot overwrite each other's count. The CASE
+        # reads the pre-increment value, so the thresholds are one lower.
+        now = timezone.now()
+        type(self).objects.filter(pk=self.pk).update(
+            failed_login_attempts=F('failed_login_attempts') + 1,
+            temporary_ban_until=Case(
+                # Ban for 24 hours after 10 failed attempts
+                When(failed_login_attempts__gte=9,
+                     then=Value(now + timedelta(hours=24))),
+                # Ban for 15 minutes after 5 failed attempts
+                When(failed_login_attempts__gte=4,
+                     then=Value(now + timedelta(minutes=15))),
+                default=F('temporary_ban_until'),
+            ),
+        )
+        self.refresh_from_db(
+            fields=['failed_login_attempts', 'temporary_ban_until'])
 
         # Return whether the account is now locked
-        return self.temporary_ban_until is not None and self.temporary_ban_until > timezone.now()
+        return self.temporary_ban_until is not None and self.temporary_ban_until > now
 
     def is_account_locked(self):
         """
@@ -274,21 +243,22 @@ class EmailVerification(models.Model):
             self.expires_at = timezone.now() + timedelta(hours=48)
         super().save(*args, **kwargs)
 
-    def is_valid(self):
+    def is_valid(self, now=None):
         """
-        Check if the verification token is still valid.
+        Check if the verification token is still valid, optionally as of ``now``.
         """
         if self.is_used:
             return False
-        return timezone.now() <= self.expires_at
+        return (now or timezone.now()) <= self.expires_at
 
     def use_token(self):
         """
         Mark the token as used and the user's email as verified.
         """
-        if self.is_valid():
+        now = timezone.now()
+        if self.is_valid(now):
             self.is_used = True
-            self.verified_at = timezone.now()
+            self.verified_at = now
             self.save()
 
             # Update user's email verification status
@@ -325,21 +295,22 @@ class PasswordReset(models.Model):
             self.expires_at = timezone.now() + timedelta(hours=24)
         super().save(*args, **kwargs)
 
-    def is_valid(self):
+    def is_valid(self, now=None):
         """
-        Check if the password reset token is still valid.
+        Check if the password reset token is still valid, optionally as of ``now``.
         """
         if self.is_used:
             return False
-        return timezone.now() <= self.expires_at
+        return (now or timezone.now()) <= self.expires_at
 
     def use_token(self):
         """
         Mark the token as used.
         """
-        if self.is_valid():
+        now = timezone.now()
+        if self.is_valid(now):
             self.is_used = True
-            self.used_at = timezone.now()
+            self.used_at = now
             self.save(update_fields=['is_used', 'used_at'])
             return True
         return False
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from .models import CustomUser, Profile
+
+
+@receiver(post_save, sender=CustomUser)
+def create_user_profile(sender, instance, created, raw=False, **kwargs):
+    """
+    Give every new user a profile. Skipped when loading fixtures, which
+    carry their own Profile rows.
+    """
+    if created and not raw:
+        Profile.objects.create(user=instance)
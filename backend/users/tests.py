@@ -1,3 +1,90 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
+
+from .admin import EstimatedCountPaginator
+
+User = get_user_model()
+
+
+class EstimatedCountPaginatorTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            User.objects.create_user(f'user{i}@example.com', f'user{i}')
+
+    def paginator(self):
+        return EstimatedCountPaginator(User.objects.order_by('pk'), 2)
+
+    def test_small_table_with_stale_estimate_paginates_exactly(self):
+        # e.g. reltuples = 0 after ANALYZE of the empty table
+        paginator = self.paginator()
+        with mock.patch.object(paginator, 'estimated_count', return_value=0):
+            self.assertEqual(paginator.count, 5)
+            self.assertEqual(paginator.num_pages, 3)
+            self.assertEqual(len(paginator.page(3).object_list), 1)
+
+    def test_large_estimate_is_used(self):
+        paginator = self.paginator()
+        estimate = EstimatedCountPaginator.ESTIMATE_THRESHOLD + 1
+        with mock.patch.object(paginator, 'estimated_count', return_value=estimate):
+            self.assertEqual(paginator.count, estimate)
+
+    def test_filtered_list_is_counted_exactly(self):
+        paginator = EstimatedCountPaginator(
+            User.objects.filter(email__startswith='user1').order_by('pk'), 2)
+        self.assertIsNone(paginator.estimated_count())
+        self.assertEqual(paginator.count, 1)
+
+
+class RecordLoginAttemptTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user('login@example.com', 'login')
+
+    def fail(self, times):
+        return [self.user.record_login_attempt(successful=False) for _ in range(times)]
+
+    def assertBannedFor(self, duration):
+        stored = User.objects.get(pk=self.user.pk)
+        self.assertEqual(stored.temporary_ban_until, self.user.temporary_ban_until)
+        remaining = stored.temporary_ban_until - timezone.now()
+        self.assertTrue(duration - timedelta(minutes=1) < remaining <= duration)
+
+    def test_four_failures_do_not_lock(self):
+        self.assertEqual(self.fail(4), [False] * 4)
+        stored = User.objects.get(pk=self.user.pk)
+        self.assertEqual(stored.failed_login_attempts, 4)
+        self.assertIsNone(stored.temporary_ban_until)
+
+    def test_fifth_failure_locks_for_15_minutes(self):
+        self.assertEqual(self.fail(5), [False] * 4 + [True])
+        self.assertEqual(self.user.failed_login_attempts, 5)
+        self.assertBannedFor(timedelta(minutes=15))
+
+    def test_tenth_failure_locks_for_24_hours(self):
+        self.fail(9)
+        self.assertBannedFor(timedelta(minutes=15))
+        self.assertTrue(self.user.record_login_attempt(successful=False))
+        self.assertEqual(self.user.failed_login_attempts, 10)
+        self.assertBannedFor(timedelta(hours=24))
+
+    def test_failures_count_from_the_stored_value(self):
+        # Another request has already failed four times; this instance is stale
+        User.objects.filter(pk=self.user.pk).update(failed_login_attempts=4)
+        self.assertTrue(self.user.record_login_attempt(successful=False))
+        self.assertEqual(self.user.failed_login_attempts, 5)
 
-# Create your tests here.
+    def test_success_resets_stored_counter_and_ban(self):
+        self.fail(5)
+        stale = User.objects.get(pk=self.user.pk)
+        stale.failed_login_attempts, stale.temporary_ban_until = 0, None
+        self.assertFalse(stale.record_login_attempt(successful=True))
+        stored = User.objects.get(pk=self.user.pk)
+        self.assertEqual(stored.failed_login_attempts, 0)
+        self.assertIsNone(stored.temporary_ban_until)
+        self.assertEqual(self.user.login_logs.count(), 6)
@@ -1040,11 +1040,8 @@ class SocialAuthCompleteView(views.APIView):
                         is_active=True,
                         is_email_verified=True  # Auto-verify OAuth users
                     )
-                    # Create profile and subscription for new users
-                    try:
-                        Profile.objects.create(user=user)
-                    except Exception as e:
-                        logger.error(f"Error creating profile: {str(e)}")
+                    # Create subscription for new users; the profile is
+                    # created by the post_save signal
                     try:
                         Subscription.create_for_user(user)
                     except Exception as e:
@@ -1090,11 +1087,8 @@ class SocialAuthCompleteView(views.APIView):
                         is_active=True,
                         is_email_verified=True  # Auto-verify OAuth users
                     )
-                    # Create profile and subscription for new users
-                    try:
-                        Profile.objects.create(user=user)
-                    except Exception as e:
-                        logger.error(f"Error creating profile: {str(e)}")
+                    # Create subscription for new users; the profile is
+                    # created by the post_save signal
                     try:
                         Subscription.create_for_user(user)
                     except Exception as e: